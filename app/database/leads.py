@@ -3,7 +3,8 @@ Database module for storing leads
 Uses Supabase for storage
 """
 import os
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import uuid
 
@@ -15,8 +16,27 @@ except ImportError:
     SUPABASE_AVAILABLE = False
 
 
+# Lead rows are buffered and inserted in batches by a background task
+LEAD_BATCH_SIZE = 100
+LEAD_FLUSH_INTERVAL = 0.5  # seconds
+LEAD_QUEUE_SIZE = 10_000
+LEAD_INSERT_ATTEMPTS = 2  # a failed batch is retried once
+LEAD_RETRY_DELAY = 0.5  # seconds
+
+# Shared client, created on first use so the HTTP connection pool is reused
+_supabase_client: Optional[Any] = None
+
+_lead_queue: Optional[asyncio.Queue] = None
+_lead_writer_task: Optional[asyncio.Task] = None
+
+
 def get_supabase_client() -> Optional[Any]:
     """Get Supabase client if configured."""
+    global _supabase_client
+
+    if _supabase_client is not None:
+        return _supabase_client
+
     if not SUPABASE_AVAILABLE:
         return None
     
@@ -29,48 +49,172 @@ def get_supabase_client() -> Optional[Any]:
     
     try:
         print(f"Initializing Supabase with URL: {url[:20]}...")
-        return create_client(url, key)
+        _supabase_client = create_client(url, key)
+        return _supabase_client
     except Exception as e:
         print(f"Error initializing Supabase client: {str(e)}")
         return None
 
 
+def close_supabase_client() -> None:
+    """Close the shared Supabase client and its HTTP session."""
+    global _supabase_client
+
+    client, _supabase_client = _supabase_client, None
+    if client is None:
+        return
+
+    try:
+        client.postgrest.aclose()
+    except Exception as e:
+        print(f"Error closing Supabase client: {e}")
+
+
+async def _insert_rows(client: Any, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert rows with a single request.
+    The client is synchronous, so the call runs in a worker thread.
+    """
+    await asyncio.to_thread(
+        lambda: client.table("visibility_leads").insert(rows).execute()
+    )
+
+
+async def _insert_leads(rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert lead rows into Supabase, as one batch where possible.
+    A failed batch is retried once, then inserted row by row so a single
+    bad row does not lose the others.
+    """
+    client = get_supabase_client()
+    
+    if not client:
+        # Log locally if Supabase not configured
+        for row in rows:
+            print(f"Lead captured: {row['email']} - {row['url']} - Score: {row['score']}")
+        return
+    
+    for attempt in range(LEAD_INSERT_ATTEMPTS):
+        try:
+            await _insert_rows(client, rows)
+            return
+        except Exception as e:
+            print(f"Error saving {len(rows)} lead(s) to Supabase (attempt {attempt + 1}): {e}")
+        if attempt < LEAD_INSERT_ATTEMPTS - 1:
+            await asyncio.sleep(LEAD_RETRY_DELAY)
+    
+    if len(rows) == 1:
+        # Don't fail the request if DB save fails
+        return
+    
+    for row in rows:
+        try:
+            await _insert_rows(client, [row])
+        except Exception as e:
+            print(f"Error saving lead {row['id']} ({row['email']}) to Supabase: {e}")
+
+
+async def _lead_writer(queue: asyncio.Queue) -> None:
+    """
+    Drain the lead queue, inserting up to LEAD_BATCH_SIZE rows at a time.
+    A batch is flushed when full or LEAD_FLUSH_INTERVAL after its first row.
+    A None item flushes the pending batch and stops the writer.
+    """
+    loop = asyncio.get_running_loop()
+    stopping = False
+    
+    while not stopping:
+        row = await queue.get()
+        if row is None:
+            break
+        
+        rows = [row]
+        deadline = loop.time() + LEAD_FLUSH_INTERVAL
+        while len(rows) < LEAD_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if row is None:
+                stopping = True
+                break
+            rows.append(row)
+        
+        await _insert_leads(rows)
+
+
+def start_lead_writer() -> None:
+    """Start the background task that batches lead inserts."""
+    global _lead_queue, _lead_writer_task
+    
+    _lead_queue = asyncio.Queue(maxsize=LEAD_QUEUE_SIZE)
+    _lead_writer_task = asyncio.create_task(_lead_writer(_lead_queue))
+
+
+async def stop_lead_writer() -> None:
+    """Flush pending leads and stop the background writer."""
+    global _lead_queue, _lead_writer_task
+    
+    queue, task = _lead_queue, _lead_writer_task
+    _lead_queue, _lead_writer_task = None, None
+    if queue is None or task is None:
+        return
+    
+    if not task.done():
+        await queue.put(None)
+    try:
+        await task
+    except Exception as e:
+        print(f"Lead writer stopped with error: {e}")
+    
+    # Insert anything the writer did not get to
+    rows = []
+    while not queue.empty():
+        row = queue.get_nowait()
+        if row is not None:
+            rows.append(row)
+    if rows:
+        await _insert_leads(rows)
+
+
 async def save_lead(
     url: str,
     email: str,
     name: Optional[str],
     score: int,
-    analysis_data: Dict[str, Any]
+    analysis_data: Dict[str, Any],
+    lead_id: Optional[str] = None
 ) -> str:
     """
     Save lead and analysis data to Supabase.
-    Returns the lead ID.
+    Rows are queued for the background writer when it is running,
+    otherwise (or when the queue is full) inserted directly.
+    Returns the lead ID (generated unless one is given).
     """
-    lead_id = str(uuid.uuid4())
+    lead_id = lead_id or str(uuid.uuid4())
     
-    client = get_supabase_client()
+    data = {
+        "id": lead_id,
+        "url": url,
+        "email": email,
+        "name": name,
+        "score": score,
+        "status": analysis_data.get("status"),
+        "analysis_data": analysis_data,
+        "created_at": datetime.utcnow().isoformat()
+    }
     
-    if client:
+    if _lead_queue is not None and _lead_writer_task is not None and not _lead_writer_task.done():
         try:
-            data = {
-                "id": lead_id,
-                "url": url,
-                "email": email,
-                "name": name,
-                "score": score,
-                "status": analysis_data.get("status"),
-                "analysis_data": analysis_data,
-                "created_at": datetime.utcnow().isoformat()
-            }
-            
-            client.table("visibility_leads").insert(data).execute()
-            
-        except Exception as e:
-            print(f"Error saving to Supabase: {e}")
-            # Don't fail the request if DB save fails
-    else:
-        # Log locally if Supabase not configured
-        print(f"Lead captured: {email} - {url} - Score: {score}")
+            _lead_queue.put_nowait(data)
+            return lead_id
+        except asyncio.QueueFull:
+            print("Lead queue full, inserting directly")
+    
+    await _insert_leads([data])
     
     return lead_id
 
@@ -83,7 +227,9 @@ async def get_lead(lead_id: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        response = client.table("visibility_leads").select("*").eq("id", lead_id).single().execute()
+        response = await asyncio.to_thread(
+            lambda: client.table("visibility_leads").select("*").eq("id", lead_id).single().execute()
+        )
         return response.data
     except Exception as e:
         print(f"Error fetching lead: {e}")
@@ -3,11 +3,42 @@ Email sender module
 Sends PDF reports using Resend API
 """
 import os
+import asyncio
+import multiprocessing
 import resend
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Any, Optional
 import base64
 
-from ..pdf.generator import generate_pdf
+from ..pdf.generator import generate_pdf, LOGO_URL
+
+
+# WeasyPrint is CPU-bound and holds the GIL, so PDFs are rendered in
+# worker processes to keep the event loop responsive
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the PDF worker pool, creating it on first use."""
+    global _pdf_pool
+    
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            # spawn: forking a process with running threads is unsafe
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Wait for running renders and stop the PDF worker pool."""
+    global _pdf_pool
+    
+    pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
 
 
 async def send_report_email(
@@ -19,6 +50,11 @@ async def send_report_email(
     """
     Generate PDF report and send via Resend.
     """
+    # Failed analyses have no report to send
+    if analysis.get("status") == "error":
+        print(f"Analysis failed for {url}, skipping email")
+        return False
+    
     resend.api_key = os.getenv("RESEND_API_KEY")
     
     if not resend.api_key:
@@ -26,12 +62,15 @@ async def send_report_email(
         return False
     
     try:
-        # Generate PDF
-        pdf_bytes = generate_pdf(
-            url=url,
-            name=name,
-            analysis=analysis
-        )
+        # Generate PDF in a worker process
+        try:
+            pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+                get_pdf_pool(), generate_pdf, url, name, analysis
+            )
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next report
+            shutdown_pdf_pool()
+            raise
         
         # Encode PDF for attachment
         pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
@@ -68,7 +107,7 @@ async def send_report_email(
         <body>
             <div class="container">
                 <div class="header">
-                    <img src="https://qtrypzzcjebvfcihiynt.supabase.co/storage/v1/object/public/base44-prod/public/68f4b4cc4cb80c1c1c673731/5febdb421_LOGOGOVA.png" alt="GOVA" class="logo">
+                    <img src="{LOGO_URL}" alt="GOVA" class="logo">
                 </div>
                 
                 <p>{greeting},</p>
@@ -83,7 +122,7 @@ async def send_report_email(
                 <p><strong>Resumen rápido:</strong></p>
                 <ul>
                     <li>Contenido detectado: {analysis.get('summary', {}).get('word_count', 0)} palabras</li>
-                    <li>Estructura HTML: {len([s for s in analysis.get('breakdown', {}).values() if s.get('status') == 'excellent'])} elementos excelentes</li>
+                    <li>Estructura HTML: {sum(1 for s in analysis.get('breakdown', {}).values() if s.get('status') == 'excellent')} elementos excelentes</li>
                     <li>Schema.org: {"✅ Detectado" if analysis.get('summary', {}).get('has_schema') else "❌ No detectado"}</li>
                 </ul>
                 
@@ -136,9 +175,9 @@ async def send_report_email(
             ]
         }
         
-        # Send email via Resend
+        # Send email via Resend; the SDK is blocking, so it runs in a thread
         try:
-            resend.Emails.send(params)
+            await asyncio.to_thread(resend.Emails.send, params)
             return True
         except Exception as e:
             print(f"Resend error: {e}")
@@ -2,14 +2,14 @@
 Main URL analyzer service
 Orchestrates all analysis modules and calculates final score
 """
-import httpx
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-import re
-from typing import Dict, Any, List
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from typing import Dict, Any
 import asyncio
+import sys
 
-from .content import extract_content, count_words
+from .cache import AsyncTTLCache
+from .http_client import get_text
+from .content import parse_html, extract_content
 from .structure import analyze_structure
 from .robots import analyze_robots
 from .schema_detector import detect_schema
@@ -29,16 +29,26 @@ AI_CRAWLERS = [
     "Bytespider"
 ]
 
+# Names with their interned lowercase form, as robots.txt matching needs them
+AI_CRAWLERS_NORMALIZED = tuple((crawler, sys.intern(crawler.lower())) for crawler in AI_CRAWLERS)
+
 # Request headers simulating GPTBot
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; GPTBot/1.0; +https://openai.com/gptbot)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
-    "Accept-Encoding": "gzip, deflate",
-    "Connection": "keep-alive"
+    "Accept-Encoding": "gzip, deflate, br"
 }
 
 
+# Full analyses are reused for repeat requests of the same page
+ANALYSIS_CACHE_TTL = 600  # seconds
+_analysis_cache = AsyncTTLCache(maxsize=512, ttl=ANALYSIS_CACHE_TTL)
+
+# Query parameters that do not change the page content
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "mc_cid", "mc_eid"}
+
+
 # Generic User Agent for fallback
 GENERIC_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -52,32 +62,74 @@ async def fetch_url(url: str, timeout: int = 30) -> tuple[str, int, bool]:
     Fetch URL content. 
     Returns: (html_content, status_code, is_ai_blocked)
     """
-    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
-        # Step 1: Try with AI User Agent
-        try:
-            response = await client.get(url, headers=HEADERS)
-            if response.status_code == 200:
-                return response.text, 200, False
+    # Step 1: Try with AI User Agent
+    try:
+        status_code, text = await get_text(url, HEADERS, timeout)
+        if status_code == 200:
+            return text, 200, False
+        
+        # If blocked (403/401), try fallback
+        if status_code in [401, 403]:
+            print(f"AI User Agent blocked (Status {status_code}). Trying fallback...")
+            fallback_status_code, fallback_text = await get_text(url, GENERIC_HEADERS, timeout)
+            return fallback_text, fallback_status_code, True
             
-            # If blocked (403/401), try fallback
-            if response.status_code in [401, 403]:
-                print(f"AI User Agent blocked (Status {response.status_code}). Trying fallback...")
-                fallback_response = await client.get(url, headers=GENERIC_HEADERS)
-                return fallback_response.text, fallback_response.status_code, True
-                
-            return response.text, response.status_code, False
-        except Exception as e:
-            print(f"Fetch error: {e}")
-            return "", 500, False
-
-
-async def analyze_url(url: str) -> Dict[str, Any]:
+        return text, status_code, False
+    except Exception as e:
+        print(f"Fetch error: {e}")
+        return "", 500, False
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache key.
+    Lowercases scheme and host, drops the fragment and tracking parameters.
+    """
+    parsed = urlparse(url)
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ])
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        parsed.params,
+        query,
+        ""
+    ))
+
+
+async def analyze_url(url: str, force: bool = False) -> Dict[str, Any]:
+    """
+    Analyze a URL, reusing a cached result for ANALYSIS_CACHE_TTL.
+    Concurrent requests for the same page share a single analysis.
+    With force, the page is analyzed again and the cache refreshed.
+    Failed analyses are not cached.
+    """
+    return await _analysis_cache.get(
+        normalize_url(url),
+        lambda: _analyze_url(url),
+        cacheable=lambda result: result["status"] != "error",
+        refresh=force
+    )
+
+
+async def _analyze_url(url: str) -> Dict[str, Any]:
     """
     Main analysis function.
     Fetches the URL and analyzes its visibility for AI crawlers.
     """
-    # Fetch HTML content
-    html_content, status_code, is_ai_blocked = await fetch_url(url)
+    parsed_url = urlparse(url)
+    # Scheme and host are case-insensitive; lowercase them so robots cache keys match
+    robots_url = f"{parsed_url.scheme.lower()}://{parsed_url.netloc.lower()}/robots.txt"
+    
+    # Fetch HTML content and robots.txt concurrently
+    (html_content, status_code, is_ai_blocked), crawlers_status = await asyncio.gather(
+        fetch_url(url),
+        analyze_robots(robots_url, AI_CRAWLERS_NORMALIZED)
+    )
     
     if status_code >= 400:
         return {
@@ -92,22 +144,17 @@ async def analyze_url(url: str) -> Dict[str, Any]:
             "crawlers": {"GPTBot": "blocked"}
         }
     
-    # Parse HTML
-    soup = BeautifulSoup(html_content, 'lxml')
+    # Parse HTML once; the analyzers below only read the tree
+    tree = parse_html(html_content)
     
     # Extract text content
-    content_data = extract_content(soup)
+    content_data = extract_content(tree)
     
     # Analyze HTML structure
-    structure_data = analyze_structure(soup)
-    
-    # Check robots.txt
-    parsed_url = urlparse(url)
-    robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-    crawlers_status = await analyze_robots(robots_url, AI_CRAWLERS)
+    structure_data = analyze_structure(tree)
     
     # Detect Schema.org
-    schema_data = detect_schema(soup)
+    schema_data = detect_schema(tree)
     
     # Calculate scores
     scores = calculate_score(
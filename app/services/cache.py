@@ -0,0 +1,57 @@
+"""
+In-process cache module
+TTL caches for coroutine results with single-flight loading
+"""
+import asyncio
+from cachetools import TTLCache
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class AsyncTTLCache:
+    """
+    TTL cache for the results of coroutines.
+    Concurrent misses for the same key share a single call.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        refresh: bool = False
+    ) -> Any:
+        """
+        Get the cached value for key, or await load() to produce it.
+        Values for which cacheable() returns False are not stored.
+        With refresh, a cached value is ignored and replaced.
+        """
+        if not refresh:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, load, cacheable))
+            self._inflight[key] = task
+
+        # Shield the shared call from cancellation of a single caller
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        try:
+            value = await load()
+            if cacheable is None or cacheable(value):
+                self._cache[key] = value
+            return value
+        finally:
+            self._inflight.pop(key, None)
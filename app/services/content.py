@@ -2,9 +2,11 @@
 Content extraction module
 Extracts visible text from HTML without JavaScript
 """
-from bs4 import BeautifulSoup, Tag
+import copy
 import re
-from typing import Dict, Any
+import lxml.html
+from lxml import etree
+from typing import Dict, Any, List
 
 
 # SPA framework markers (empty divs that indicate client-side rendering)
@@ -23,24 +25,62 @@ EXCLUDE_TAGS = [
     'canvas', 'video', 'audio', 'head', 'meta', 'link'
 ]
 
+def _spa_markers_xpath() -> str:
+    """
+    Build one XPath for all SPA markers: a union with one named-tag step
+    per tag, e.g. //div[@id='root' or @id='app'] | //app-root.
+    """
+    predicates: Dict[str, List[str]] = {}
+    for tag_name, attrs in SPA_MARKERS:
+        predicates.setdefault(tag_name, []).append(
+            ' and '.join(f'@{name}={value!r}' for name, value in attrs.items())
+        )
+    
+    branches = []
+    for tag_name, tag_predicates in predicates.items():
+        if all(tag_predicates):
+            branches.append(f"//{tag_name}[{' or '.join(f'({p})' if ' and ' in p else p for p in tag_predicates)}]")
+        else:
+            branches.append(f'//{tag_name}')  # a marker without attributes matches any
+    return ' | '.join(branches)
+
+
+# All SPA markers as a single compiled query; named-tag steps let
+# libxml2 skip non-matching elements cheaply
+SPA_MARKERS_XPATH = etree.XPath(_spa_markers_xpath())
+
+# Text inside a SPA container (script/style code is not text)
+SPA_TEXT_XPATH = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
+# Inline scripts and styles are dropped before parsing so lxml builds a
+# smaller tree; JSON-LD scripts are kept for schema detection
+STRIP_BLOCKS_RE = re.compile(
+    rb'<script\b(?![^>]*application/ld\+json)[^>]*>.*?</script\s*>'
+    rb'|<style\b[^>]*>.*?</style\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Parse from UTF-8 bytes: lxml rejects str input that carries an XML
+# encoding declaration (common in XHTML pages)
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
 
-def extract_content(soup: BeautifulSoup) -> Dict[str, Any]:
+
+def extract_content(tree: lxml.html.HtmlElement) -> Dict[str, Any]:
     """
-    Extract visible text content from HTML.
+    Extract visible text content from a parsed HTML tree.
     Detects if it's an empty SPA shell.
+    The tree is not modified, so it can be shared with other analyzers.
     """
     # Check for SPA markers
-    is_spa_empty = check_spa_empty(soup)
-    
-    # Remove unwanted tags
-    for tag in soup(EXCLUDE_TAGS):
-        tag.decompose()
+    is_spa_empty = check_spa_empty(tree)
     
-    # Extract text
-    text = soup.get_text(separator=' ', strip=True)
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Extract text from a copy with the unwanted tags emptied, and
+    # collapse whitespace. Emptying (rather than stripping) keeps each
+    # tail as its own text chunk, so words on either side stay apart.
+    visible = copy.deepcopy(tree)
+    for elem in list(visible.iter(*EXCLUDE_TAGS)):
+        elem.clear(keep_tail=True)
+    text = ' '.join(' '.join(visible.itertext()).split())
     
     # Count words
     word_count = count_words(text)
@@ -53,22 +93,34 @@ def extract_content(soup: BeautifulSoup) -> Dict[str, Any]:
     }
 
 
-def check_spa_empty(soup: BeautifulSoup) -> bool:
+def parse_html(html: str) -> lxml.html.HtmlElement:
+    """
+    Parse an HTML document into an lxml tree.
+    Script (except JSON-LD) and style blocks are removed first.
+    Empty documents yield an empty <html> element.
+    """
+    try:
+        return lxml.html.document_fromstring(
+            STRIP_BLOCKS_RE.sub(b'', html.encode('utf-8')),
+            parser=HTML_PARSER
+        )
+    except etree.ParserError:
+        return lxml.html.document_fromstring(b'<html></html>', parser=HTML_PARSER)
+
+
+def check_spa_empty(tree: lxml.html.HtmlElement) -> bool:
     """
     Check if the page is an empty SPA shell (content loaded via JS).
     """
-    for tag_name, attrs in SPA_MARKERS:
-        elements = soup.find_all(tag_name, attrs)
-        for elem in elements:
-            if isinstance(elem, Tag):
-                # Get text content of the container
-                inner_text = elem.get_text(strip=True)
-                # If the container has very little text, it's likely empty SPA
-                if len(inner_text) < 100:
-                    # Check if there are meaningful children
-                    children = [c for c in elem.children if isinstance(c, Tag)]
-                    if len(children) <= 3:
-                        return True
+    for elem in SPA_MARKERS_XPATH(tree):
+        # Get text content of the container
+        inner_text = ''.join(t.strip() for t in SPA_TEXT_XPATH(elem))
+        # If the container has very little text, it's likely empty SPA
+        if len(inner_text) < 100:
+            # Check if there are meaningful children
+            children = [c for c in elem if isinstance(c.tag, str)]
+            if len(children) <= 3:
+                return True
     return False
 
 
@@ -0,0 +1,117 @@
+"""
+Shared HTTP client module
+Keeps a single connection pool for all outgoing requests
+"""
+import asyncio
+import httpx
+from urllib.parse import urlparse
+from typing import Dict, Optional, Tuple
+
+
+# Connection pool limits
+LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+
+DEFAULT_TIMEOUT = 30
+
+# Outgoing request limits
+MAX_CONCURRENT_FETCHES = 32
+HOST_MIN_INTERVAL = 0.25  # seconds between requests to the same host
+FETCH_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5  # seconds, doubled on each retry
+RETRY_BACKOFF_MAX = 4
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+# Only the start of a body is downloaded; a page's title, meta tags,
+# headings and SPA markers are found there, and robots.txt is small
+MAX_BODY_BYTES = 512 * 1024
+
+_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+_host_next_slot: Dict[str, float] = {}
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use."""
+    global _client
+
+    if _client is None or _client.is_closed:
+        # HTTP/2 is negotiated over TLS; plain HTTP origins stay on HTTP/1.1
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=LIMITS
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared AsyncClient and its pooled connections."""
+    global _client
+
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _wait_for_host(host: str) -> None:
+    """Space out requests to the same host by at least HOST_MIN_INTERVAL."""
+    now = asyncio.get_running_loop().time()
+    
+    # Forget hosts whose slot has already passed
+    if len(_host_next_slot) > 1024:
+        for known_host, slot in list(_host_next_slot.items()):
+            if slot <= now:
+                del _host_next_slot[known_host]
+    
+    slot = max(now, _host_next_slot.get(host, now))
+    _host_next_slot[host] = slot + HOST_MIN_INTERVAL
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+async def _read_text(response: httpx.Response) -> str:
+    """Read and decode at most MAX_BODY_BYTES of a streamed response body."""
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) >= MAX_BODY_BYTES:
+            break
+    return body[:MAX_BODY_BYTES].decode(response.encoding or 'utf-8', errors='replace')
+
+
+async def get_text(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    pace: bool = True
+) -> Tuple[int, str]:
+    """
+    GET a URL with the shared client, streaming at most MAX_BODY_BYTES.
+    All outgoing fetches go through here.
+    Caps concurrent requests, paces requests per host and retries
+    connection errors and 429/5xx responses with exponential backoff.
+    Timeouts are not retried, they already used up the time budget.
+    With pace=False the request skips host pacing, e.g. for the one
+    robots.txt fetch made alongside a page fetch to the same host.
+    Returns: (status_code, text)
+    """
+    host = urlparse(url).netloc
+    
+    for attempt in range(FETCH_RETRIES):
+        last_attempt = attempt == FETCH_RETRIES - 1
+        if pace:
+            await _wait_for_host(host)
+        try:
+            async with _fetch_semaphore:
+                async with get_client().stream("GET", url, headers=headers, timeout=timeout) as response:
+                    if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                        return response.status_code, await _read_text(response)
+        except httpx.TimeoutException:
+            raise
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+        
+        await asyncio.sleep(min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
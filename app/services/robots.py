@@ -2,115 +2,118 @@
 robots.txt analysis module
 Checks if AI crawlers are allowed or blocked
 """
-import httpx
-from typing import Dict, List, Any
+from typing import Dict, Any, Iterable, Sequence, Tuple
 import re
+import sys
 
+from .cache import AsyncTTLCache
+from .http_client import get_text
 
-async def analyze_robots(robots_url: str, ai_crawlers: List[str]) -> Dict[str, Any]:
+
+ROBOTS_TIMEOUT = 10  # seconds
+
+# robots.txt results are reused for repeat analyses of the same site
+ROBOTS_CACHE_TTL = 1800  # seconds
+_robots_cache = AsyncTTLCache(maxsize=10_000, ttl=ROBOTS_CACHE_TTL)
+
+# One match per directive line: (field, value), without inline comments
+DIRECTIVE_RE = re.compile(
+    r'^[ \t]*(user-agent|disallow|allow)[ \t]*:[ \t]*([^\r\n#]*)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+# AI crawlers as (name, interned lowercase name) pairs
+CrawlerNames = Sequence[Tuple[str, str]]
+
+
+async def analyze_robots(robots_url: str, ai_crawlers: CrawlerNames) -> Dict[str, Any]:
+    """
+    Analyze robots.txt for AI crawler permissions, cached for ROBOTS_CACHE_TTL.
+    Concurrent analyses of the same site share a single fetch.
+    Failed fetches are not cached.
+    """
+    return await _robots_cache.get(
+        (robots_url, tuple(ai_crawlers)),
+        lambda: _fetch_robots(robots_url, ai_crawlers),
+        cacheable=lambda result: "error" not in result
+    )
+
+
+async def _fetch_robots(robots_url: str, ai_crawlers: CrawlerNames) -> Dict[str, Any]:
     """
     Fetch and analyze robots.txt for AI crawler permissions.
     """
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(robots_url)
-            
-            if response.status_code == 404:
-                # No robots.txt = all allowed
-                return {
-                    "exists": False,
-                    "allows_all": True,
-                    "crawlers": {crawler: "allowed" for crawler in ai_crawlers}
-                }
-            
-            if response.status_code != 200:
-                return {
-                    "exists": False,
-                    "allows_all": True,
-                    "error": f"Could not fetch robots.txt (status {response.status_code})",
-                    "crawlers": {crawler: "unknown" for crawler in ai_crawlers}
-                }
-            
-            robots_content = response.text
-            return parse_robots(robots_content, ai_crawlers)
-            
+        status_code, robots_content = await get_text(robots_url, timeout=ROBOTS_TIMEOUT, pace=False)
+        
+        if status_code == 404:
+            # No robots.txt = all allowed
+            return {
+                "exists": False,
+                "allows_all": True,
+                "crawlers": {crawler: "allowed" for crawler, _ in ai_crawlers}
+            }
+        
+        if status_code != 200:
+            return {
+                "exists": False,
+                "allows_all": True,
+                "error": f"Could not fetch robots.txt (status {status_code})",
+                "crawlers": {crawler: "unknown" for crawler, _ in ai_crawlers}
+            }
+        
+        return parse_robots(robots_content, ai_crawlers)
+        
     except Exception as e:
         return {
             "exists": False,
             "allows_all": True,
             "error": str(e),
-            "crawlers": {crawler: "unknown" for crawler in ai_crawlers}
+            "crawlers": {crawler: "unknown" for crawler, _ in ai_crawlers}
         }
 
 
-def parse_robots(content: str, ai_crawlers: List[str]) -> Dict[str, Any]:
+def _is_blocked(rule_list: Iterable[Tuple[str, str]]) -> bool:
+    """Check if a user-agent's rules disallow the whole site."""
+    return any(rule_type == 'disallow' and path in ('/', '') for rule_type, path in rule_list)
+
+
+def parse_robots(content: str, ai_crawlers: CrawlerNames) -> Dict[str, Any]:
     """
     Parse robots.txt content and check each AI crawler.
     """
-    lines = content.lower().split('\n')
-    
     # Build rules per user-agent
     current_agents = []
     rules = {}  # {user-agent: [rules]}
     
-    for line in lines:
-        line = line.strip()
+    for match in DIRECTIVE_RE.finditer(content):
+        field = match.group(1).lower()
+        value = match.group(2).strip()
         
-        # Skip comments and empty lines
-        if not line or line.startswith('#'):
-            continue
-        
-        if line.startswith('user-agent:'):
-            agent = line.split(':', 1)[1].strip()
+        if field == 'user-agent':
+            agent = sys.intern(value.lower())
             current_agents = [agent]
             if agent not in rules:
                 rules[agent] = []
-        elif line.startswith('disallow:') and current_agents:
-            path = line.split(':', 1)[1].strip()
-            for agent in current_agents:
-                if agent not in rules:
-                    rules[agent] = []
-                rules[agent].append(('disallow', path))
-        elif line.startswith('allow:') and current_agents:
-            path = line.split(':', 1)[1].strip()
+        elif current_agents:
             for agent in current_agents:
-                if agent not in rules:
-                    rules[agent] = []
-                rules[agent].append(('allow', path))
+                rules[agent].append((field, value))
     
-    # Check each AI crawler
+    # Check each AI crawler; wildcard rules apply to crawlers without their own
+    wildcard_blocked = _is_blocked(rules.get('*', ()))
     crawlers_status = {}
     blocked_count = 0
     
-    for crawler in ai_crawlers:
-        crawler_lower = crawler.lower()
-        
-        # Check specific rules for this crawler
+    for crawler, crawler_lower in ai_crawlers:
         if crawler_lower in rules:
-            # Check if disallowed
-            for rule_type, path in rules[crawler_lower]:
-                if rule_type == 'disallow' and path in ['/', '']:
-                    crawlers_status[crawler] = "blocked"
-                    blocked_count += 1
-                    break
-            else:
-                crawlers_status[crawler] = "allowed"
-        # Check wildcard rules
-        elif '*' in rules:
-            for rule_type, path in rules['*']:
-                if rule_type == 'disallow' and path in ['/', '']:
-                    crawlers_status[crawler] = "blocked"
-                    blocked_count += 1
-                    break
-            else:
-                crawlers_status[crawler] = "allowed"
+            blocked = _is_blocked(rules[crawler_lower])
         else:
-            crawlers_status[crawler] = "allowed"
-    
-    # Check if specific crawler names are blocked
-    for crawler in ai_crawlers:
-        if crawler not in crawlers_status:
-            crawlers_status[crawler] = "allowed"
+            blocked = wildcard_blocked
+        
+        crawlers_status[crawler] = "blocked" if blocked else "allowed"
+        if blocked:
+            blocked_count += 1
     
     return {
         "exists": True,
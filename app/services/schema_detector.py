@@ -2,12 +2,17 @@
 Schema.org detection module
 Detects JSON-LD and Microdata structured data
 """
-from bs4 import BeautifulSoup
-import json
-from typing import Dict, Any, List
+import lxml.html
+from lxml import etree
+import orjson
+from typing import Dict, Any
 
 
-def detect_schema(soup: BeautifulSoup) -> Dict[str, Any]:
+# JSON-LD scripts and Microdata items as a single query, so the tree is walked once
+SCHEMA_XPATH = etree.XPath("//*[(self::script and @type='application/ld+json') or @itemscope]")
+
+
+def detect_schema(tree: lxml.html.HtmlElement) -> Dict[str, Any]:
     """
     Detect Schema.org structured data in JSON-LD and Microdata formats.
     """
@@ -18,14 +23,20 @@ def detect_schema(soup: BeautifulSoup) -> Dict[str, Any]:
         "types": []
     }
     
-    # Detect JSON-LD
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+    json_ld_scripts = []
+    microdata_elements = []
+    for element in SCHEMA_XPATH(tree):
+        if element.tag == 'script' and element.get('type') == 'application/ld+json':
+            json_ld_scripts.append(element)
+        if element.get('itemscope') is not None:
+            microdata_elements.append(element)
     
+    # Detect JSON-LD
     for script in json_ld_scripts:
         try:
-            content = script.string
+            content = script.text
             if content:
-                data = json.loads(content)
+                data = orjson.loads(content)
                 
                 # Handle both single objects and arrays
                 if isinstance(data, list):
@@ -46,12 +57,10 @@ def detect_schema(soup: BeautifulSoup) -> Dict[str, Any]:
                     if schema_type not in result['types']:
                         result['types'].append(schema_type)
                         
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             continue
     
     # Detect Microdata
-    microdata_elements = soup.find_all(itemscope=True)
-    
     for element in microdata_elements:
         item_type = element.get('itemtype', '')
         if item_type:
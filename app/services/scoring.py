@@ -2,7 +2,8 @@
 Scoring system module
 Calculates visibility score based on analysis results
 """
-from typing import Dict, Any
+from bisect import bisect_right
+from typing import Dict, Any, Tuple
 
 
 # Score configuration
@@ -46,6 +47,33 @@ SCORE_CONFIG = {
 }
 
 
+# Category scores as (minimum value, score, status) rows, highest minimum first
+CONTENT_SCORES = ((500, 25, "excellent"), (200, 15, "good"), (50, 8, "warning"), (0, 2, "critical"))
+DESCRIPTION_SCORES = ((161, 5, "warning"), (120, 10, "excellent"), (1, 5, "warning"), (0, 0, "critical"))
+H1_SCORES = ((2, 5, "warning"), (1, 10, "excellent"), (0, 0, "critical"))
+STRUCTURE_SCORES = ((4, 10, "excellent"), (2, 6, "good"), (1, 3, "warning"), (0, 0, "critical"))
+ROBOTS_BLOCKED_SCORES = ((5, 0, "critical"), (1, 5, "warning"), (0, 10, "excellent"))
+ALT_TEXT_SCORES = ((80, 5, "excellent"), (50, 3, "warning"), (0, 0, "critical"))
+
+# Overall status by score: below 30, 30-49, 50-69, 70-84, 85 and above
+STATUS_THRESHOLDS = (30, 50, 70, 85)
+STATUSES = (
+    {"status": "crítico", "emoji": "🔴", "color": "#ef4444"},
+    {"status": "deficiente", "emoji": "🟠", "color": "#f97316"},
+    {"status": "mejorable", "emoji": "🟡", "color": "#f59e0b"},
+    {"status": "bueno", "emoji": "🟢", "color": "#22c55e"},
+    {"status": "excelente", "emoji": "✅", "color": "#22c55e"},
+)
+
+
+def _lookup(table: Tuple[Tuple[int, int, str], ...], value: int) -> Tuple[int, str]:
+    """Get (score, status) from the first row whose minimum the value reaches."""
+    for minimum, score, status in table:
+        if value >= minimum:
+            return score, status
+    return table[-1][1], table[-1][2]
+
+
 def calculate_score(
     content_data: Dict[str, Any],
     structure_data: Dict[str, Any],
@@ -59,20 +87,24 @@ def calculate_score(
     """
     breakdown = {}
     
-    # 1. Content score (max 25)
+    # Read every input once
     word_count = content_data.get("word_count", 0)
-    if word_count >= 500:
-        content_score = 25
-        content_status = "excellent"
-    elif word_count >= 200:
-        content_score = 15
-        content_status = "good"
-    elif word_count >= 50:
-        content_score = 8
-        content_status = "warning"
-    else:
-        content_score = 2
-        content_status = "critical"
+    is_spa_empty = content_data.get("is_spa_empty", False)
+    has_content = content_data.get("has_content", False)
+    has_title = structure_data.get("has_title")
+    title_length = structure_data.get("title_length", 0)
+    title = structure_data.get("title", "No detectado")
+    desc_length = structure_data.get("description_length", 0)
+    h1_count = structure_data.get("h1_count", 0)
+    semantic_count = structure_data.get("semantic_count", 0)
+    alt_percentage = structure_data.get("images_alt_percentage", 100)
+    allows_all = robots_data.get("allows_all", False)
+    blocked_count = robots_data.get("blocked_count", 0)
+    has_schema = schema_data.get("has_schema", False)
+    schema_types = schema_data.get("types")
+    
+    # 1. Content score (max 25)
+    content_score, content_status = _lookup(CONTENT_SCORES, word_count)
     
     breakdown["content"] = {
         "score": content_score,
@@ -82,10 +114,10 @@ def calculate_score(
     }
     
     # 2. Title score (max 10)
-    if structure_data.get("has_title") and structure_data.get("title_length", 0) >= 10:
+    if has_title and title_length >= 10:
         title_score = 10
         title_status = "excellent"
-    elif structure_data.get("has_title"):
+    elif has_title:
         title_score = 5
         title_status = "warning"
     else:
@@ -96,20 +128,11 @@ def calculate_score(
         "score": title_score,
         "max": 10,
         "status": title_status,
-        "detail": structure_data.get("title", "No detectado")[:60]
+        "detail": title[:60]
     }
     
-    # 3. Meta description score (max 10)
-    desc_length = structure_data.get("description_length", 0)
-    if 120 <= desc_length <= 160:
-        desc_score = 10
-        desc_status = "excellent"
-    elif structure_data.get("has_description"):
-        desc_score = 5
-        desc_status = "warning"
-    else:
-        desc_score = 0
-        desc_status = "critical"
+    # 3. Meta description score (max 10): ideal is 120-160 characters
+    desc_score, desc_status = _lookup(DESCRIPTION_SCORES, desc_length)
     
     breakdown["description"] = {
         "score": desc_score,
@@ -118,17 +141,8 @@ def calculate_score(
         "detail": f"{desc_length} caracteres" if desc_length > 0 else "No detectado"
     }
     
-    # 4. H1 score (max 10)
-    h1_count = structure_data.get("h1_count", 0)
-    if h1_count == 1:
-        h1_score = 10
-        h1_status = "excellent"
-    elif h1_count > 1:
-        h1_score = 5
-        h1_status = "warning"
-    else:
-        h1_score = 0
-        h1_status = "critical"
+    # 4. H1 score (max 10): exactly one is best
+    h1_score, h1_status = _lookup(H1_SCORES, h1_count)
     
     breakdown["h1"] = {
         "score": h1_score,
@@ -138,19 +152,7 @@ def calculate_score(
     }
     
     # 5. Semantic structure score (max 10)
-    semantic_count = structure_data.get("semantic_count", 0)
-    if semantic_count >= 4:
-        struct_score = 10
-        struct_status = "excellent"
-    elif semantic_count >= 2:
-        struct_score = 6
-        struct_status = "good"
-    elif semantic_count >= 1:
-        struct_score = 3
-        struct_status = "warning"
-    else:
-        struct_score = 0
-        struct_status = "critical"
+    struct_score, struct_status = _lookup(STRUCTURE_SCORES, semantic_count)
     
     breakdown["structure"] = {
         "score": struct_score,
@@ -160,10 +162,10 @@ def calculate_score(
     }
     
     # 6. Not empty SPA score (max 15)
-    if not content_data.get("is_spa_empty", False) and content_data.get("has_content", False):
+    if not is_spa_empty and has_content:
         spa_score = 15
         spa_status = "excellent"
-    elif content_data.get("is_spa_empty", False):
+    elif is_spa_empty:
         spa_score = 0
         spa_status = "critical"
     else:
@@ -174,43 +176,25 @@ def calculate_score(
         "score": spa_score,
         "max": 15,
         "status": spa_status,
-        "detail": "SPA vacía detectada" if content_data.get("is_spa_empty") else "Contenido visible sin JS"
+        "detail": "SPA vacía detectada" if is_spa_empty else "Contenido visible sin JS"
     }
     
     # 7. robots.txt score (max 10)
-    if robots_data.get("allows_all", False):
+    if allows_all:
         robots_score = 10
         robots_status = "excellent"
     else:
-        blocked_count = robots_data.get("blocked_count", 0)
-        if blocked_count > 4:
-            robots_score = 0
-            robots_status = "critical"
-        elif blocked_count > 0:
-            robots_score = 5
-            robots_status = "warning"
-        else:
-            robots_score = 10
-            robots_status = "excellent"
+        robots_score, robots_status = _lookup(ROBOTS_BLOCKED_SCORES, blocked_count)
     
     breakdown["robots"] = {
         "score": robots_score,
         "max": 10,
         "status": robots_status,
-        "detail": f"{robots_data.get('blocked_count', 0)} crawlers bloqueados"
+        "detail": f"{blocked_count} crawlers bloqueados"
     }
     
     # 8. Image alt text score (max 5)
-    alt_percentage = structure_data.get("images_alt_percentage", 100)
-    if alt_percentage >= 80:
-        alt_score = 5
-        alt_status = "excellent"
-    elif alt_percentage >= 50:
-        alt_score = 3
-        alt_status = "warning"
-    else:
-        alt_score = 0
-        alt_status = "critical"
+    alt_score, alt_status = _lookup(ALT_TEXT_SCORES, alt_percentage)
     
     breakdown["alt_text"] = {
         "score": alt_score,
@@ -220,7 +204,7 @@ def calculate_score(
     }
     
     # 9. Schema.org score (max 5)
-    if schema_data.get("has_schema", False):
+    if has_schema:
         schema_score = 5
         schema_status = "excellent"
     else:
@@ -231,7 +215,7 @@ def calculate_score(
         "score": schema_score,
         "max": 5,
         "status": schema_status,
-        "detail": ", ".join(schema_data.get("types", []))[:50] if schema_data.get("types") else "No detectado"
+        "detail": ", ".join(schema_types)[:50] if schema_types else "No detectado"
     }
     
     # 10. AI Bot Accessibility (WAF/Cloudflare)
@@ -266,13 +250,4 @@ def get_status(score: int) -> Dict[str, str]:
     """
     Get status label and emoji based on total score.
     """
-    if score >= 85:
-        return {"status": "excelente", "emoji": "✅", "color": "#22c55e"}
-    elif score >= 70:
-        return {"status": "bueno", "emoji": "🟢", "color": "#22c55e"}
-    elif score >= 50:
-        return {"status": "mejorable", "emoji": "🟡", "color": "#f59e0b"}
-    elif score >= 30:
-        return {"status": "deficiente", "emoji": "🟠", "color": "#f97316"}
-    else:
-        return {"status": "crítico", "emoji": "🔴", "color": "#ef4444"}
+    return STATUSES[bisect_right(STATUS_THRESHOLDS, score)]
@@ -2,78 +2,91 @@
 HTML structure analysis module
 Analyzes semantic HTML elements, meta tags, headings, etc.
 """
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List
+import lxml.html
+from typing import Dict, Any
 
 
-def analyze_structure(soup: BeautifulSoup) -> Dict[str, Any]:
+# Tags read by analyze_structure, collected in a single walk of the tree
+SEMANTIC_TAGS = ('main', 'article', 'section', 'nav', 'header', 'footer')
+STRUCTURE_TAGS = ('title', 'meta', 'h1', 'h2', 'h3', 'img', 'a') + SEMANTIC_TAGS
+
+
+def analyze_structure(tree: lxml.html.HtmlElement) -> Dict[str, Any]:
     """
     Analyze HTML structure for SEO and AI visibility.
     """
     result = {}
     
+    # Walk the tree once, counting tags and keeping the first matches
+    counts = dict.fromkeys(STRUCTURE_TAGS, 0)
+    title_tag = None
+    meta_desc = None
+    robots_meta = None
+    h1_tags = []
+    images_with_alt = 0
+    
+    for el in tree.iter(*STRUCTURE_TAGS):
+        tag = el.tag
+        if tag == 'meta':
+            name = el.get('name')
+            if name == 'description' and meta_desc is None:
+                meta_desc = el
+            elif name == 'robots' and robots_meta is None:
+                robots_meta = el
+        elif tag == 'title':
+            if title_tag is None:
+                title_tag = el
+        elif tag == 'h1':
+            if len(h1_tags) < 5:
+                h1_tags.append(el)
+        elif tag == 'img':
+            if el.get('alt'):
+                images_with_alt += 1
+        elif tag == 'a' and el.get('href') is None:
+            continue
+        counts[tag] += 1
+    
     # Title tag
-    title_tag = soup.find('title')
-    result['has_title'] = title_tag is not None and bool(title_tag.string)
-    result['title'] = title_tag.string.strip() if title_tag and title_tag.string else ""
+    title_text = title_tag.text if title_tag is not None else None
+    result['has_title'] = bool(title_text)
+    result['title'] = title_text.strip() if title_text else ""
     result['title_length'] = len(result['title'])
     
     # Meta description
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
-    desc_content = meta_desc.get('content', '') if meta_desc else ''
+    desc_content = meta_desc.get('content', '') if meta_desc is not None else ''
     result['has_description'] = bool(desc_content)
     result['description'] = desc_content
     result['description_length'] = len(desc_content)
     
     # Headings
-    h1_tags = soup.find_all('h1')
-    result['h1_count'] = len(h1_tags)
-    result['h1_texts'] = [h.get_text(strip=True) for h in h1_tags[:5]]  # First 5
-    
-    h2_tags = soup.find_all('h2')
-    result['h2_count'] = len(h2_tags)
-    
-    h3_tags = soup.find_all('h3')
-    result['h3_count'] = len(h3_tags)
+    result['h1_count'] = counts['h1']
+    result['h1_texts'] = [''.join(t.strip() for t in h.itertext()) for h in h1_tags]  # First 5
+    result['h2_count'] = counts['h2']
+    result['h3_count'] = counts['h3']
     
     # Semantic elements
-    result['has_main'] = soup.find('main') is not None
-    result['has_article'] = soup.find('article') is not None
-    result['has_section'] = soup.find('section') is not None
-    result['has_nav'] = soup.find('nav') is not None
-    result['has_header'] = soup.find('header') is not None
-    result['has_footer'] = soup.find('footer') is not None
-    
-    # Count semantic elements
-    semantic_count = sum([
-        result['has_main'],
-        result['has_article'],
-        result['has_section'],
-        result['has_nav'],
-        result['has_header'],
-        result['has_footer']
-    ])
+    semantic_count = 0
+    for tag in SEMANTIC_TAGS:
+        present = counts[tag] > 0
+        result[f'has_{tag}'] = present
+        semantic_count += present
     result['semantic_count'] = semantic_count
     
     # Images analysis
-    images = soup.find_all('img')
-    result['total_images'] = len(images)
-    
-    images_with_alt = [img for img in images if img.get('alt')]
-    result['images_with_alt'] = len(images_with_alt)
+    total_images = counts['img']
+    result['total_images'] = total_images
+    result['images_with_alt'] = images_with_alt
     
-    if len(images) > 0:
-        result['images_alt_percentage'] = round((len(images_with_alt) / len(images)) * 100)
+    if total_images > 0:
+        result['images_alt_percentage'] = round((images_with_alt / total_images) * 100)
     else:
         result['images_alt_percentage'] = 100  # No images = no problem
     
     # Links
-    links = soup.find_all('a', href=True)
-    result['total_links'] = len(links)
+    result['total_links'] = counts['a']
     
     # Check for noai/noimageai meta
-    robots_meta = soup.find('meta', attrs={'name': 'robots'})
-    robots_content = robots_meta.get('content', '').lower() if robots_meta else ''
+    robots_content = robots_meta.get('content', '').lower() if robots_meta is not None else ''
     result['has_noai'] = 'noai' in robots_content
     result['has_noimageai'] = 'noimageai' in robots_content
     
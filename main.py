@@ -4,15 +4,24 @@ Main FastAPI application entry point
 """
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, EmailStr, HttpUrl, field_validator
-from typing import Optional
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, field_validator
+from typing import Optional, Dict, Any
 import os
+import re
+import uuid
+import asyncio
 from dotenv import load_dotenv
 
 from app.services.analyzer import analyze_url
-from app.email.sender import send_report_email
-from app.database.leads import save_lead
+from app.services.http_client import close_client
+from app.email.sender import send_report_email, shutdown_pdf_pool
+from app.database.leads import (
+    save_lead,
+    start_lead_writer,
+    stop_lead_writer,
+    close_supabase_client,
+)
 
 load_dotenv()
 
@@ -21,7 +30,8 @@ app = FastAPI(
     description="Analiza la visibilidad de sitios web para crawlers de IA",
     version="1.0.1",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 @app.get("/health")
@@ -39,19 +49,31 @@ app.add_middleware(
 )
 
 
+# Cheap syntactic checks; the email address is confirmed by delivering the report
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+URL_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+
 class AnalysisRequest(BaseModel):
     url: str
-    email: EmailStr
+    email: str
     name: Optional[str] = None
     consent: bool
     
     @field_validator('url')
     @classmethod
     def validate_url(cls, v):
-        if not v.startswith(('http://', 'https://')):
+        if not URL_SCHEME_RE.match(v):
             v = 'https://' + v
         return v
     
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v):
+        if not EMAIL_RE.fullmatch(v):
+            raise ValueError('El email no es válido')
+        return v
+    
     @field_validator('consent')
     @classmethod  
     def validate_consent(cls, v):
@@ -74,6 +96,46 @@ class AnalysisResponse(BaseModel):
     pdf_sent: bool
 
 
+async def deliver_report(request: AnalysisRequest, result: Dict[str, Any], lead_id: str) -> None:
+    """
+    Save the lead and email the PDF report concurrently.
+    They are independent, and background tasks would otherwise run one after the other.
+    """
+    outcomes = await asyncio.gather(
+        save_lead(
+            url=request.url,
+            email=request.email,
+            name=request.name,
+            score=result["score"],
+            analysis_data=result,
+            lead_id=lead_id
+        ),
+        send_report_email(
+            email=request.email,
+            name=request.name,
+            url=request.url,
+            analysis=result
+        ),
+        return_exceptions=True
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            print(f"Error delivering report for {request.url}: {outcome}")
+
+
+@app.on_event("startup")
+async def startup():
+    start_lead_writer()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await stop_lead_writer()
+    close_supabase_client()
+    await close_client()
+    shutdown_pdf_pool()
+
+
 @app.get("/")
 async def root():
     return {
@@ -83,38 +145,24 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
-
-
 @app.post("/api/analyze", response_model=AnalysisResponse)
-async def analyze_website(request: AnalysisRequest, background_tasks: BackgroundTasks):
+async def analyze_website(
+    request: AnalysisRequest,
+    background_tasks: BackgroundTasks,
+    force: bool = False
+):
     """
     Analiza una URL y devuelve el informe de visibilidad IA.
     También envía el PDF por email y guarda el lead.
+    Con ?force=true se ignora el resultado en caché.
     """
     try:
-        # Perform analysis
-        result = await analyze_url(request.url)
+        # Perform analysis (cached per URL unless forced)
+        result = await analyze_url(request.url, force=force)
         
-        # Save lead to database
-        lead_id = await save_lead(
-            url=request.url,
-            email=request.email,
-            name=request.name,
-            score=result["score"],
-            analysis_data=result
-        )
-        
-        # Send PDF report via email in background
-        background_tasks.add_task(
-            send_report_email,
-            email=request.email,
-            name=request.name,
-            url=request.url,
-            analysis=result
-        )
+        # Save lead and send PDF report in background; the ID is known up front
+        lead_id = str(uuid.uuid4())
+        background_tasks.add_task(deliver_report, request, result, lead_id)
         
         return AnalysisResponse(
             success=True,